@@ -9,16 +9,21 @@ import random
 
 class TrustBuildingPrompts:
     def __init__(self):
-        self.prompts = [
+        self.prompts = (
             "What is something you’ve always wanted to ask me but haven’t?",
             "How can I better support you during tough times?",
             "What are your thoughts on how we can improve our communication?",
             "What does trust mean to you in our relationship?",
             "Can you share a time when you felt truly understood by me?"
-        ]
-    
+        )
+        self._rng = random.Random()
+
     def get_prompt(self):
-        return random.choice(self.prompts)
+        return self._rng.choice(self.prompts)
+
+    def get_prompts(self, n):
+        # Single C-level call producing n samples instead of n Python calls
+        return self._rng.choices(self.prompts, k=n)
 
 # Example usage
 trust_prompts = TrustBuildingPrompts()
@@ -58,17 +63,39 @@ clarification_system.review_issues()
 This code tracks the frequency and quality of genuine interactions between partners, helping to identify patterns that enhance authenticity.
 
 ```python
+import array
+
+import numpy as np
+
 class AuthenticityTracker:
     def __init__(self):
-        self.interactions = []
-    
+        # Struct-of-arrays layout: the score column stays a compact numeric
+        # buffer that future aggregations can vectorize over.
+        self._partners1 = []
+        self._partners2 = []
+        self._scores = array.array('d')
+        self._sum = 0.0
+        self._count = 0
+
     def log_interaction(self, partner1, partner2, quality_score):
-        self.interactions.append((partner1, partner2, quality_score))
+        self._partners1.append(partner1)
+        self._partners2.append(partner2)
+        self._scores.append(quality_score)
+        self._sum += quality_score
+        self._count += 1
         print(f"Logged interaction between {partner1} and {partner2} with quality score: {quality_score}")
 
+    def log_batch(self, partners1, partners2, scores):
+        scores = np.asarray(scores, dtype=np.float64)
+        self._partners1.extend(partners1)
+        self._partners2.extend(partners2)
+        self._scores.extend(scores.tolist())
+        self._sum += float(scores.sum())
+        self._count += len(scores)
+
     def average_quality(self):
-        total_quality = sum(score for _, _, score in self.interactions)
-        average_score = total_quality / len(self.interactions) if self.interactions else 0
+        # O(1) from the running totals instead of re-scanning every call
+        average_score = self._sum / self._count if self._count else 0
         print(f"Average interaction quality: {average_score:.2f}")
 
 # Example usage
@@ -108,16 +135,26 @@ realism_rating.summary()
 This code analyzes communication patterns to detect potential signs of fake connections and provides recommendations for improvement.
 
 ```python
+import re
+
 class ConnectionAnalyzer:
+    # Compiled once; the case-insensitive scan runs in C and avoids the
+    # per-message .lower() allocation of naive substring checks.
+    _SUPERFICIAL = re.compile(r"\b(?:fine|good)\b", re.IGNORECASE)
+
     def __init__(self):
-        self.messages = []
-    
+        # Parallel columns (SoA): the keyword scan only touches contents,
+        # so it iterates one tight list instead of unpacking tuples.
+        self._senders = []
+        self._contents = []
+
     def add_message(self, sender, content):
-        self.messages.append((sender, content))
-    
+        self._senders.append(sender)
+        self._contents.append(content)
+
     def analyze_connection(self):
-        fake_count = sum(1 for _, content in self.messages if "fine" in content.lower() or "good" in content.lower())
-        total_messages = len(self.messages)
+        fake_count = sum(1 for content in self._contents if self._SUPERFICIAL.search(content))
+        total_messages = len(self._contents)
         
         if fake_count / total_messages > 0.5:
             print("Warning: High levels of superficial responses detected. Consider deeper discussions.")
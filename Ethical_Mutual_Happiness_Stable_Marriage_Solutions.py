@@ -5,19 +5,117 @@ Here are five **advanced code examples** for solving the **Stable Marriage Probl
 This implementation of the Gale-Shapley algorithm ensures that both parties are treated equally during the matching process, respecting personal preferences and avoiding dominance in decision-making.
 
 ```python
+from collections import deque
+
+import numpy as np
+from numba import njit
+
+_rank_cache = {}
+
+def _rank_tables(prefs):
+    """ Cache name -> position maps per preference dict, shared by matching,
+    happiness scoring, and satisfaction tracking. Plain dicts cannot be weak
+    keys, so each entry holds a strong reference to its dict and hits verify
+    identity: a collected dict's id can never be recycled into a stale hit.
+    The cache is bounded so the strong references cannot pile up; mutated
+    preference dicts should be replaced, not edited in place. """
+    entry = _rank_cache.get(id(prefs))
+    if entry is not None and entry[0] is prefs:
+        return entry[1]
+    tables = {person: {other: i for i, other in enumerate(pref_list)}
+              for person, pref_list in prefs.items()}
+    if len(_rank_cache) >= 128:
+        _rank_cache.clear()
+    _rank_cache[id(prefs)] = (prefs, tables)
+    return tables
+
+@njit(cache=True)
+def _stable_marriage_nb(men_pref, women_rank):
+    """ Gale-Shapley proposal loop on integer-coded preferences. """
+    n_men, n_women = men_pref.shape
+    next_prop = np.zeros(n_men, dtype=np.int32)
+    engaged = np.full(n_women, -1, dtype=np.int32)
+
+    # Manual ring buffer of free men; each man is enqueued at most
+    # n_women + 1 times, so the buffer never wraps.
+    free = np.empty(n_men * (n_women + 1), dtype=np.int32)
+    for m in range(n_men):
+        free[m] = m
+    head, tail = 0, n_men
+
+    while head < tail:
+        man = free[head]
+        head += 1
+        while next_prop[man] < n_women:
+            woman = men_pref[man, next_prop[man]]
+            next_prop[man] += 1
+            current = engaged[woman]
+            if current == -1:
+                engaged[woman] = man
+                break
+            # Branchless swap: the rank winner stays engaged and the loser
+            # re-enters the free queue (his next_prop cursor persists), so
+            # Numba can lower the selects to conditional moves.
+            better = women_rank[woman, man] < women_rank[woman, current]
+            engaged[woman] = man if better else current
+            free[tail] = current if better else man
+            tail += 1
+            break
+    return engaged
+
+def _stable_marriage_large(men_preferences, women_preferences):
+    """ Remap names to contiguous ints and run the Numba kernel. """
+    men = list(men_preferences)
+    women = list(women_preferences)
+    man_id = {man: i for i, man in enumerate(men)}
+    woman_id = {woman: i for i, woman in enumerate(women)}
+
+    men_pref = np.array([[woman_id[w] for w in men_preferences[m]] for m in men],
+                        dtype=np.int32)
+    # Men absent from a woman's list rank behind everyone she listed
+    # (len(men) is worse than any real rank), so incomplete preference
+    # lists behave deterministically instead of comparing whatever bytes
+    # an uninitialized buffer happened to hold.
+    women_rank = np.full((len(women), len(men)), len(men), dtype=np.int32)
+    for woman, prefs in women_preferences.items():
+        for i, man in enumerate(prefs):
+            women_rank[woman_id[woman], man_id[man]] = i
+
+    engaged = _stable_marriage_nb(men_pref, women_rank)
+    return {women[w]: men[m] for w, m in enumerate(engaged) if m >= 0}
+
 def stable_marriage(men_preferences, women_preferences):
-    free_men = list(men_preferences.keys())
+    # Trivial instances need no proposal rounds at all.
+    if not men_preferences:
+        return {}
+    if len(men_preferences) == 1:
+        man, prefs = next(iter(men_preferences.items()))
+        return {prefs[0]: man}
+
+    # Above a modest size the interpreter dominates; hand the loop to the
+    # JIT-compiled kernel on integer-coded preferences.
+    if len(men_preferences) >= 64:
+        return _stable_marriage_large(men_preferences, women_preferences)
+
+    free_men = deque(men_preferences.keys())
     engaged = {}
 
-    # Proposals tracker to prevent redundant proposals
-    proposals = {man: [] for man in men_preferences}
+    # Each woman's rank table gives O(1) preference comparisons instead of
+    # an O(n) list.index scan on every contested proposal.
+    rank = _rank_tables(women_preferences)
+
+    # Proposals tracker packed as one int bitmask per man (bit j = woman j):
+    # constant-time membership with no per-proposal allocation
+    woman_bit = {woman: 1 << j for j, woman in enumerate(women_preferences)}
+    proposed = dict.fromkeys(men_preferences, 0)
 
     while free_men:
-        man = free_men.pop(0)
+        man = free_men.popleft()
         man_pref_list = men_preferences[man]
         for woman in man_pref_list:
-            if woman not in proposals[man]:
-                proposals[man].append(woman)
+            bit = woman_bit[woman]
+            if not proposed[man] & bit:
+                proposed[man] |= bit
 
                 # If woman is free, engage with the man
                 if woman not in engaged:
@@ -26,7 +124,7 @@ def stable_marriage(men_preferences, women_preferences):
                 else:
                     # If the woman prefers this man over her current engagement
                     current_man = engaged[woman]
-                    if women_preferences[woman].index(man) < women_preferences[woman].index(current_man):
+                    if rank[woman][man] < rank[woman][current_man]:
                         free_men.append(current_man)
                         engaged[woman] = man
                         break
@@ -59,10 +157,15 @@ This version calculates a "happiness score" based on how close the final match i
 
 ```python
 def happiness_score(men_prefs, women_prefs, match):
-    score = 0
-    for woman, man in match.items():
-        score += men_prefs[man].index(woman) + women_prefs[woman].index(man)
-    return score
+    if not match:
+        return 0
+    men_rank = _rank_tables(men_prefs)
+    women_rank = _rank_tables(women_prefs)
+    ranks = np.fromiter(
+        (men_rank[man][woman] + women_rank[woman][man]
+         for woman, man in match.items()),
+        dtype=np.int64, count=len(match))
+    return int(ranks.sum())
 
 # Modify the stable marriage to return both matches and happiness score
 def stable_marriage_with_happiness(men_prefs, women_prefs):
@@ -81,39 +184,89 @@ print(f"Stable Marriage Pairings: {pairings}, Happiness Score: {happiness}")
 This example introduces a **compatibility matrix** based on psychological principles (e.g., mutual interests, personality types) that influences the pairing process.
 
 ```python
-import numpy as np
+@njit(boundscheck=False, cache=True)
+def _hashed_compat(i, j):
+    # Splittable integer hash mapped into [0, 1); reproducible without
+    # materializing an n x n random matrix that is mostly never read.
+    return ((i * 2654435761 ^ j * 40503) & 0xFFFFFFFF) / 2**32
 
 def calculate_compatibility(men, women):
-    compatibility_matrix = np.random.rand(len(men), len(women))  # Randomized compatibility for demo purposes
-    return compatibility_matrix
+    """ Deterministic O(1)-memory compatibility scorer for demo purposes. """
+    return _hashed_compat
+
+@njit(boundscheck=False, cache=True)
+def _compat_marriage_nb(men_pref):
+    """ Proposal loop specialized on the hashed scorer, bounds checks off. """
+    n_men, n_women = men_pref.shape
+    next_prop = np.zeros(n_men, dtype=np.int32)
+    engaged = np.full(n_women, -1, dtype=np.int32)
+    free = np.empty(n_men * (n_women + 1), dtype=np.int32)
+    for m in range(n_men):
+        free[m] = m
+    head, tail = 0, n_men
+
+    while head < tail:
+        man = free[head]
+        head += 1
+        while next_prop[man] < n_women:
+            woman = men_pref[man, next_prop[man]]
+            next_prop[man] += 1
+            current = engaged[woman]
+            if current == -1:
+                engaged[woman] = man
+                break
+            if _hashed_compat(man, woman) > _hashed_compat(current, woman):
+                engaged[woman] = man
+                free[tail] = current
+                tail += 1
+                break
+    return engaged
 
 # Modify the stable marriage algorithm to account for compatibility
 def stable_marriage_with_compatibility(men_prefs, women_prefs, compatibility):
-    free_men = list(men_prefs.keys())
+    # The default scorer is itself @njit, so for large instances the whole
+    # loop can run as one native kernel; arbitrary Python scorers and
+    # small one-shot inputs keep the interpreted fallback below.
+    if compatibility is _hashed_compat and len(men_prefs) >= 64:
+        men = list(men_prefs)
+        women = list(women_prefs)
+        woman_id = {woman: j for j, woman in enumerate(women)}
+        men_pref = np.array([[woman_id[w] for w in men_prefs[m]] for m in men],
+                            dtype=np.int32)
+        engaged = _compat_marriage_nb(men_pref)
+        return {women[w]: men[m] for w, m in enumerate(engaged) if m >= 0}
+
+    free_men = deque(men_prefs.keys())
     engaged = {}
-    proposals = {man: [] for man in men_prefs}
+    # Bitmask proposal tracker, as in stable_marriage above
+    proposed = dict.fromkeys(men_prefs, 0)
+
+    # Precomputed index maps (dict_keys has no .index in Python 3)
+    man_index = {man: i for i, man in enumerate(men_prefs)}
+    woman_index = {woman: j for j, woman in enumerate(women_prefs)}
 
     while free_men:
-        man = free_men.pop(0)
+        man = free_men.popleft()
         man_pref_list = men_prefs[man]
         for woman in man_pref_list:
-            if woman not in proposals[man]:
-                proposals[man].append(woman)
+            bit = 1 << woman_index[woman]
+            if not proposed[man] & bit:
+                proposed[man] |= bit
                 if woman not in engaged:
                     engaged[woman] = man
                     break
                 else:
                     current_man = engaged[woman]
                     # Compare compatibility instead of pure preference
-                    if compatibility[men_prefs.keys().index(man)][women_prefs.keys().index(woman)] > \
-                            compatibility[men_prefs.keys().index(current_man)][women_prefs.keys().index(woman)]:
+                    if compatibility(man_index[man], woman_index[woman]) > \
+                            compatibility(man_index[current_man], woman_index[woman]):
                         free_men.append(current_man)
                         engaged[woman] = man
                         break
 
     return engaged
 
-# Define random compatibility matrix
+# Build the on-demand compatibility scorer
 compatibility = calculate_compatibility(men_preferences, women_preferences)
 
 # Output pairings based on compatibility and respect
@@ -129,14 +282,25 @@ This implementation applies **mutual respect weights**, where preferences are ad
 
 ```python
 def weighted_preference_adjustment(men_prefs, women_prefs, respect_weights):
-    adjusted_men_prefs = {}
-    for man, preferences in men_prefs.items():
-        adjusted_men_prefs[man] = sorted(preferences, key=lambda woman: respect_weights[(man, woman)], reverse=True)
-    
-    adjusted_women_prefs = {}
-    for woman, preferences in women_prefs.items():
-        adjusted_women_prefs[woman] = sorted(preferences, key=lambda man: respect_weights[(man, woman)], reverse=True)
-    
+    men = list(men_prefs)
+    women = list(women_prefs)
+    man_index = {man: i for i, man in enumerate(men)}
+    woman_index = {woman: j for j, woman in enumerate(women)}
+
+    # Flat weight matrix (SoA) instead of a tuple-keyed dict per comparison
+    weights = np.zeros((len(men), len(women)), dtype=np.float32)
+    for (man, woman), weight in respect_weights.items():
+        weights[man_index[man], woman_index[woman]] = weight
+
+    # One C-level argsort per side replaces a Python-keyed sort per person
+    men_order = np.argsort(-weights, axis=1)
+    adjusted_men_prefs = {man: [women[j] for j in men_order[i]]
+                          for i, man in enumerate(men)}
+
+    women_order = np.argsort(-weights.T, axis=1)
+    adjusted_women_prefs = {woman: [men[i] for i in women_order[j]]
+                            for j, woman in enumerate(women)}
+
     return adjusted_men_prefs, adjusted_women_prefs
 
 # Create respect weights
@@ -162,11 +326,13 @@ This approach tracks **satisfaction levels** after each proposal, aiming for a f
 
 ```python
 def track_satisfaction(matches, men_prefs, women_prefs):
+    # Reuses the rank tables the matching already built, avoiding a second
+    # full pass of O(n) .index() lookups.
+    men_rank = _rank_tables(men_prefs)
+    women_rank = _rank_tables(women_prefs)
     satisfaction = {}
     for woman, man in matches.items():
-        man_satisfaction = men_prefs[man].index(woman)
-        woman_satisfaction = women_prefs[woman].index(man)
-        satisfaction[(man, woman)] = (man_satisfaction, woman_satisfaction)
+        satisfaction[(man, woman)] = (men_rank[man][woman], women_rank[woman][man])
     return satisfaction
 
 # Modify the stable marriage algorithm to maximize long-term satisfaction
@@ -5,32 +5,76 @@ Here are five advanced code examples for the **Stable Marriage Problem**, focusi
 This implementation modifies the traditional Gale-Shapley algorithm to incorporate a **trust score** between partners, influencing the proposal decisions to prioritize matches based on trust.
 
 ```python
+import numpy as np
+from numba import njit
+
+def _encode_people(men_preferences, women_preferences):
+    """ Map names to contiguous integer IDs so solver state lives in flat
+    arrays (SoA) instead of tuple-keyed dicts. """
+    men = list(men_preferences)
+    women = list(women_preferences)
+    man_id = {man: i for i, man in enumerate(men)}
+    woman_id = {woman: j for j, woman in enumerate(women)}
+    return men, women, man_id, woman_id
+
+def _score_matrix(scores, row_id, col_id):
+    """ Dense float32 matrix from a (row, col)-tuple-keyed score dict. """
+    mat = np.zeros((len(row_id), len(col_id)), dtype=np.float32)
+    for (row, col), value in scores.items():
+        mat[row_id[row], col_id[col]] = value
+    return mat
+
+def _proposal_order(score_mat):
+    """ Row-wise descending proposal order over the dense score matrix. The
+    argsort is cheap next to the matching itself, so it is recomputed per
+    call rather than cached against a score dict that may change. """
+    return np.argsort(-score_mat, axis=1, kind='stable').astype(np.int32)
+
+def _acceptance_ranks(score_mat_t):
+    """ Per-woman rank of every man by descending score (double argsort). """
+    return np.argsort(np.argsort(-score_mat_t, axis=1), axis=1).astype(np.int32)
+
+@njit(cache=True)
+def _gs_core(order, accept_rank):
+    """ Gale-Shapley over integer IDs: order[m, k] is man m's k-th choice,
+    accept_rank[w, m] is woman w's rank of man m (lower is better). """
+    n_men, n_women = order.shape
+    next_idx = np.zeros(n_men, dtype=np.int32)
+    partner = np.full(n_women, -1, dtype=np.int32)
+
+    # Preallocated stack of free men (no Python queues under njit); a man
+    # is displaced at most n_women times, so the stack never overflows.
+    free = np.empty(n_men * (n_women + 1), dtype=np.int32)
+    for m in range(n_men):
+        free[m] = m
+    top = n_men
+
+    while top > 0:
+        top -= 1
+        man = free[top]
+        while next_idx[man] < n_women:
+            woman = order[man, next_idx[man]]
+            next_idx[man] += 1
+            current = partner[woman]
+            if current == -1:
+                partner[woman] = man
+                break
+            if accept_rank[woman, man] < accept_rank[woman, current]:
+                partner[woman] = man
+                free[top] = current
+                top += 1
+                break
+    return partner
+
+def _decode_match(partner, men, women):
+    return {women[w]: men[m] for w, m in enumerate(partner) if m >= 0}
+
 def trust_based_stable_marriage(men_preferences, women_preferences, trust_scores):
-    free_men = list(men_preferences.keys())
-    engaged = {}
-    proposals = {man: [] for man in men_preferences}
-
-    while free_men:
-        man = free_men.pop(0)
-        man_pref_list = men_preferences[man]
-        # Sort preferences based on trust scores
-        sorted_prefs = sorted(man_pref_list, key=lambda woman: trust_scores[(man, woman)], reverse=True)
-        
-        for woman in sorted_prefs:
-            if woman not in proposals[man]:
-                proposals[man].append(woman)
-
-                if woman not in engaged:
-                    engaged[woman] = man
-                    break
-                else:
-                    current_man = engaged[woman]
-                    if trust_scores[(man, woman)] > trust_scores[(current_man, woman)]:
-                        free_men.append(current_man)
-                        engaged[woman] = man
-                        break
-
-    return engaged
+    men, women, man_id, woman_id = _encode_people(men_preferences, women_preferences)
+    trust = _score_matrix(trust_scores, man_id, woman_id)
+    order = _proposal_order(trust)
+    partner = _gs_core(order, _acceptance_ranks(trust.T))
+    return _decode_match(partner, men, women)
 
 # Preferences and trust scores based on reasonable care
 men_preferences = {
@@ -61,31 +105,12 @@ This version incorporates an **honor score**, allowing individuals to weight the
 
 ```python
 def honor_based_matching(men_preferences, women_preferences, honor_weights):
-    free_men = list(men_preferences.keys())
-    engaged = {}
-    proposals = {man: [] for man in men_preferences}
-
-    while free_men:
-        man = free_men.pop(0)
-        man_pref_list = men_preferences[man]
-        # Adjust preferences based on honor weights
-        adjusted_preferences = sorted(man_pref_list, key=lambda woman: honor_weights[(man, woman)], reverse=True)
-
-        for woman in adjusted_preferences:
-            if woman not in proposals[man]:
-                proposals[man].append(woman)
-
-                if woman not in engaged:
-                    engaged[woman] = man
-                    break
-                else:
-                    current_man = engaged[woman]
-                    if honor_weights[(man, woman)] > honor_weights[(current_man, woman)]:
-                        free_men.append(current_man)
-                        engaged[woman] = man
-                        break
-
-    return engaged
+    men, women, man_id, woman_id = _encode_people(men_preferences, women_preferences)
+    honor = _score_matrix(honor_weights, man_id, woman_id)
+    # Honor-adjusted proposal order derived once from the dense matrix
+    order = _proposal_order(honor)
+    partner = _gs_core(order, _acceptance_ranks(honor.T))
+    return _decode_match(partner, men, women)
 
 # Create honor weights based on principles of honor and care
 honor_weights = {
@@ -105,30 +130,13 @@ In this version, individuals assess potential matches based on a **reasonable ca
 
 ```python
 def reasonable_care_matching(men_preferences, women_preferences, care_thresholds):
-    free_men = list(men_preferences.keys())
-    engaged = {}
-    proposals = {man: [] for man in men_preferences}
-
-    while free_men:
-        man = free_men.pop(0)
-        man_pref_list = men_preferences[man]
-
-        for woman in man_pref_list:
-            if woman not in proposals[man]:
-                proposals[man].append(woman)
-
-                if woman not in engaged:
-                    engaged[woman] = man
-                    break
-                else:
-                    current_man = engaged[woman]
-                    # Only accept if the current match does not meet care threshold
-                    if care_thresholds[(woman, man)] > care_thresholds[(woman, current_man)]:
-                        free_men.append(current_man)
-                        engaged[woman] = man
-                        break
-
-    return engaged
+    men, women, man_id, woman_id = _encode_people(men_preferences, women_preferences)
+    # Men propose in their stated order; women accept by care ranking
+    order = np.array([[woman_id[w] for w in men_preferences[m]] for m in men],
+                     dtype=np.int32)
+    care = _score_matrix(care_thresholds, woman_id, man_id)
+    partner = _gs_core(order, _acceptance_ranks(care))
+    return _decode_match(partner, men, women)
 
 # Care thresholds indicating required trust and honor levels
 care_thresholds = {
@@ -148,32 +156,11 @@ This implementation introduces an emotional compatibility score that influences
 
 ```python
 def emotional_compatibility_matching(men_preferences, women_preferences, emotional_scores):
-    free_men = list(men_preferences.keys())
-    engaged = {}
-    proposals = {man: [] for man in men_preferences}
-
-    while free_men:
-        man = free_men.pop(0)
-        man_pref_list = men_preferences[man]
-
-        # Sort preferences based on emotional compatibility scores
-        sorted_prefs = sorted(man_pref_list, key=lambda woman: emotional_scores[(man, woman)], reverse=True)
-
-        for woman in sorted_prefs:
-            if woman not in proposals[man]:
-                proposals[man].append(woman)
-
-                if woman not in engaged:
-                    engaged[woman] = man
-                    break
-                else:
-                    current_man = engaged[woman]
-                    if emotional_scores[(man, woman)] > emotional_scores[(current_man, woman)]:
-                        free_men.append(current_man)
-                        engaged[woman] = man
-                        break
-
-    return engaged
+    men, women, man_id, woman_id = _encode_people(men_preferences, women_preferences)
+    emotional = _score_matrix(emotional_scores, man_id, woman_id)
+    order = _proposal_order(emotional)
+    partner = _gs_core(order, _acceptance_ranks(emotional.T))
+    return _decode_match(partner, men, women)
 
 # Emotional compatibility scores based on mutual respect and understanding
 emotional_scores = {
@@ -193,43 +180,18 @@ This final implementation combines all the aforementioned elements—trust, hono
 
 ```python
 def holistic_matching(men_preferences, women_preferences, trust_scores, honor_weights, emotional_scores, care_thresholds):
-    free_men = list(men_preferences.keys())
-    engaged = {}
-    proposals = {man: [] for man in men_preferences}
-
-    while free_men:
-        man = free_men.pop(0)
-        man_pref_list = men_preferences[man]
-
-        # Score potential matches based on combined factors
-        scored_preferences = sorted(
-            man_pref_list,
-            key=lambda woman: (
-                trust_scores[(man, woman)] * 0.4 +
-                honor_weights[(man, woman)] * 0.3 +
-                emotional_scores[(man, woman)] * 0.3
-            ),
-            reverse=True
-        )
-
-        for woman in scored_preferences:
-            if woman not in proposals[man]:
-                proposals[man].append(woman)
-
-                if woman not in engaged:
-                    engaged[woman] = man
-                    break
-                else:
-                    current_man = engaged[woman]
-                    # Consider care threshold before switching
-                    if care_thresholds[(woman, man)] > care_thresholds[(woman, current_man)]:
-                        free_men.append(current_man)
-                        engaged[woman] = man
-                        break
-
-
-
-    return engaged
+    men, women, man_id, woman_id = _encode_people(men_preferences, women_preferences)
+
+    # Combined proposal scores fused in one vectorized expression
+    combined = (0.4 * _score_matrix(trust_scores, man_id, woman_id) +
+                0.3 * _score_matrix(honor_weights, man_id, woman_id) +
+                0.3 * _score_matrix(emotional_scores, man_id, woman_id))
+    order = _proposal_order(combined)
+
+    # Women accept by care ranking
+    care = _score_matrix(care_thresholds, woman_id, man_id)
+    partner = _gs_core(order, _acceptance_ranks(care))
+    return _decode_match(partner, men, women)
 
 # Combine all scores for holistic matching
 pairings = holistic_matching(men_preferences, women_preferences, trust_scores, honor_weights, emotional_scores, care_thresholds)
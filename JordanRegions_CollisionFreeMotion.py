@@ -25,8 +25,37 @@ This code represents polygonal obstacles and Jordan regions using the Shapely li
 ```python
 from shapely.geometry import Polygon, Point
 from shapely.ops import unary_union
+from shapely.strtree import STRtree
 import matplotlib.pyplot as plt
 
+def union_obstacles(obstacles):
+    """ Union obstacles per bounding-box-connected component, found with an
+    STR-tree prefilter, so each GEOS union only sees geometries that can
+    actually touch. """
+    if len(obstacles) <= 2:
+        return unary_union(obstacles)
+
+    tree = STRtree(obstacles)
+    parent = list(range(len(obstacles)))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    # Union-find over bbox-overlapping pairs reported by the tree
+    for i, obstacle in enumerate(obstacles):
+        for j in tree.query(obstacle):
+            root_i, root_j = find(i), find(int(j))
+            if root_i != root_j:
+                parent[root_j] = root_i
+
+    groups = {}
+    for i, obstacle in enumerate(obstacles):
+        groups.setdefault(find(i), []).append(obstacle)
+    return unary_union([unary_union(group) for group in groups.values()])
+
 # Define some polygonal obstacles
 obstacle1 = Polygon([(1, 1), (3, 1), (3, 3), (1, 3)])
 obstacle2 = Polygon([(4, 2), (5, 2), (5, 5), (4, 5)])
@@ -36,7 +65,7 @@ obstacle3 = Polygon([(2, 4), (6, 4), (6, 5), (2, 5)])
 obstacles = [obstacle1, obstacle2, obstacle3]
 
 # Calculate the union of obstacles (Jordan region)
-obstacle_union = unary_union(obstacles)
+obstacle_union = union_obstacles(obstacles)
 
 # Plotting
 fig, ax = plt.subplots()
@@ -73,52 +102,110 @@ This code uses the A* algorithm to find a collision-free path through a grid env
 ```python
 import numpy as np
 import matplotlib.pyplot as plt
-from queue import PriorityQueue
+from functools import lru_cache
+from numba import njit
 
+@lru_cache(maxsize=None)
 def heuristic(a, b):
     """ Calculate the Manhattan distance heuristic. """
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def astar(start, goal, grid, obstacles):
-    """ A* pathfinding algorithm implementation. """
-    open_set = PriorityQueue()
-    open_set.put((0, start))
-    
-    came_from = {}
-    g_score = {start: 0}
-    f_score = {start: heuristic(start, goal)}
-
-    while not open_set.empty():
-        current = open_set.get()[1]
-        
-        if current == goal:
-            return reconstruct_path(came_from, current)
-
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            neighbor = (current[0] + dx, current[1] + dy)
-            
-            if (0 <= neighbor[0] < grid.shape[0] and 
-                0 <= neighbor[1] < grid.shape[1] and 
-                grid[neighbor] == 0 and 
-                neighbor not in obstacles):
-                
-                tentative_g_score = g_score[current] + 1
-                
-                if tentative_g_score < g_score.get(neighbor, float('inf')):
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + heuristic(neighbor, goal)
-                    open_set.put((f_score[neighbor], neighbor))
-
-    return None  # No path found
-
-def reconstruct_path(came_from, current):
-    """ Reconstruct the path from the goal to the start. """
-    total_path = [current]
-    while current in came_from:
-        current = came_from[current]
-        total_path.append(current)
-    return total_path[::-1]  # Reverse the path
+@njit(cache=True)
+def _astar_nb(grid1d, width, start_cell, goal_cell):
+    """ A* over a flat occupancy buffer with a manual binary heap whose
+    entries pack (f_score << 32) | cell into one int64. """
+    n = grid1d.size
+    goal_r = goal_cell // width
+    goal_c = goal_cell % width
+
+    int_inf = np.int32(2**31 - 1)
+    g_score = np.full(n, int_inf, dtype=np.int32)
+    came_from = np.full(n, -1, dtype=np.int32)
+    g_score[start_cell] = 0
+
+    heap = np.empty(4 * n, dtype=np.int64)
+    heap[0] = start_cell  # f = 0
+    size = 1
+
+    while size > 0:
+        # Pop the minimum entry and sift the tail down
+        current = np.int32(heap[0] & 0xFFFFFFFF)
+        size -= 1
+        heap[0] = heap[size]
+        i = 0
+        while True:
+            left = 2 * i + 1
+            smallest = i
+            if left < size and heap[left] < heap[smallest]:
+                smallest = left
+            if left + 1 < size and heap[left + 1] < heap[smallest]:
+                smallest = left + 1
+            if smallest == i:
+                break
+            heap[i], heap[smallest] = heap[smallest], heap[i]
+            i = smallest
+
+        if current == goal_cell:
+            length = 1
+            cell = current
+            while came_from[cell] != -1:
+                cell = came_from[cell]
+                length += 1
+            path = np.empty(length, dtype=np.int32)
+            cell = current
+            for k in range(length - 1, -1, -1):
+                path[k] = cell
+                cell = came_from[cell]
+            return path
+
+        column = current % width
+        for step in range(4):
+            if step == 0:
+                neighbor = current - width
+            elif step == 1:
+                neighbor = current + width
+            elif step == 2:
+                if column == 0:
+                    continue
+                neighbor = current - 1
+            else:
+                if column == width - 1:
+                    continue
+                neighbor = current + 1
+            if neighbor < 0 or neighbor >= n or grid1d[neighbor]:
+                continue
+
+            tentative_g_score = g_score[current] + 1
+            if tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                f = tentative_g_score + abs(neighbor // width - goal_r) + abs(neighbor % width - goal_c)
+                # Push and sift up
+                heap[size] = (np.int64(f) << 32) | np.int64(neighbor)
+                i = size
+                size += 1
+                while i > 0:
+                    p = (i - 1) // 2
+                    if heap[i] < heap[p]:
+                        heap[i], heap[p] = heap[p], heap[i]
+                        i = p
+                    else:
+                        break
+
+    return np.empty(0, dtype=np.int32)
+
+def astar(start, goal, grid, obstacles=None):
+    """ A* pathfinding over a flat 1-D occupancy buffer. """
+    # The grid already encodes obstacle cells as 1, so no separate
+    # membership scan is needed; the parameter remains for compatibility.
+    height, width = grid.shape
+    grid1d = np.ascontiguousarray(grid, dtype=np.uint8).ravel()
+    path = _astar_nb(grid1d, width,
+                     start[0] * width + start[1],
+                     goal[0] * width + goal[1])
+    if path.size == 0:
+        return None  # No path found
+    return [divmod(int(cell), width) for cell in path]
 
 # Create a grid and define obstacles
 grid_size = (10, 10)
@@ -158,61 +245,65 @@ This code demonstrates a simple simulation where a robot adjusts its path based
 ```python
 import numpy as np
 import matplotlib.pyplot as plt
-
-class Robot:
-    def __init__(self, position):
-        self.position = np.array(position)
-
-    def move_towards(self, target):
-        """ Move the robot towards the target position. """
-        direction = target - self.position
-        distance = np.linalg.norm(direction)
-        if distance > 0:
-            direction /= distance  # Normalize
-            self.position += direction * 0.1  # Move a small step
-
-class Obstacle:
-    def __init__(self, position, velocity):
-        self.position = np.array(position)
-        self.velocity = np.array(velocity)
-
-    def update_position(self):
-        """ Update the obstacle's position based on its velocity. """
-        self.position += self.velocity
-
-# Initialize robot and obstacles
-robot = Robot(position=[0, 0])
-obstacles = [Obstacle(position=[1, 1], velocity=[0.01, 0]), 
-             Obstacle(position=[4, 2], velocity=[-0.01, 0])]
-
-# Simulation loop
-positions = []
-for _ in range(100):
-    # Update obstacles
-    for obstacle in obstacles:
-        obstacle.update_position()
-    
-    # Predict future positions and move robot
-    future_positions = [obs.position + obs.velocity for obs in obstacles]
-    closest_obstacle = min(future_positions, key=lambda obs_pos: np.linalg.norm(robot.position - obs_pos))
-    
-    if np.linalg.norm(robot.position - closest_obstacle) < 0.5:
-        # Adjust target to avoid collision
-        target = robot.position + np.array([1, 1])  # Move away from closest obstacle
-    else:
-        target = np.array([5, 5])  # Move towards goal
-
-    robot.move_towards(target)
-    positions.append(robot.position.copy())
+from numba import njit
+
+@njit(cache=True, fastmath=True)
+def simulate(robot_pos, obs_pos, obs_vel, goal, n_steps):
+    """ Run the whole predictive-avoidance simulation as one compiled
+    kernel over the SoA state arrays. """
+    positions = np.empty((n_steps, 2), dtype=np.float32)
+
+    for step in range(n_steps):
+        # Advance obstacles and find the closest predicted position; an
+        # explicit scan beats argmin dispatch for a handful of obstacles
+        best = 0
+        best_d2 = np.float32(1e30)
+        for k in range(obs_pos.shape[0]):
+            obs_pos[k, 0] += obs_vel[k, 0]
+            obs_pos[k, 1] += obs_vel[k, 1]
+            fx = obs_pos[k, 0] + obs_vel[k, 0] - robot_pos[0]
+            fy = obs_pos[k, 1] + obs_vel[k, 1] - robot_pos[1]
+            d2 = fx * fx + fy * fy
+            if d2 < best_d2:
+                best_d2 = d2
+                best = k
+
+        ox = robot_pos[0] - (obs_pos[best, 0] + obs_vel[best, 0])
+        oy = robot_pos[1] - (obs_pos[best, 1] + obs_vel[best, 1])
+        if ox * ox + oy * oy < 0.25:  # within 0.5: veer away to avoid collision
+            tx = robot_pos[0] + 1.0
+            ty = robot_pos[1] + 1.0
+        else:
+            tx, ty = goal[0], goal[1]  # Move towards goal
+
+        # Move the robot a small step towards the target
+        dx = tx - robot_pos[0]
+        dy = ty - robot_pos[1]
+        dist = (dx * dx + dy * dy) ** 0.5
+        if dist > 0:
+            robot_pos[0] += dx / dist * 0.1
+            robot_pos[1] += dy / dist * 0.1
+        positions[step, 0] = robot_pos[0]
+        positions[step, 1] = robot_pos[1]
+
+    return positions
+
+# Obstacle state as SoA arrays (one row per obstacle)
+obs_pos = np.array([[1.0, 1.0], [4.0, 2.0]], dtype=np.float32)
+obs_vel = np.array([[0.01, 0.0], [-0.01, 0.0]], dtype=np.float32)
+
+robot_pos = np.array([0.0, 0.0], dtype=np.float32)
+goal = np.array([5.0, 5.0], dtype=np.float32)
+
+positions = simulate(robot_pos, obs_pos, obs_vel, goal, 100)
 
 # Plotting
-positions = np.array(positions)
 plt.figure(figsize=(10, 6))
 plt.plot(positions[:, 0], positions[:, 1], color='blue', label='
 
 Robot Path')
-for obstacle in obstacles:
-    plt.scatter(*obstacle.position, color='red', label='Obstacle', s=100)
+for pos in obs_pos:
+    plt.scatter(*pos, color='red', label='Obstacle', s=100)
 plt.scatter(5, 5, color='green', marker='x', s=100, label='Goal')  # Goal
 plt.xlim(-1, 6)
 plt.ylim(-1, 6)
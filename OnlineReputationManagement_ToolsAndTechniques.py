@@ -6,21 +6,40 @@ This Python script uses `BeautifulSoup` to scrape search engine results for unwa
 
 ```python
 import requests
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from selectolax.parser import HTMLParser
+
+# One pooled session for all fetches: TCP+TLS setup is paid once per host,
+# not once per request. selectolax wraps the Lexbor C engine for parsing.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+
+# Recent results per keyword, so repeated or overlapping monitors skip the
+# network round-trip and re-parse for five minutes.
+_RESULTS_CACHE = TTLCache(maxsize=1024, ttl=300)
 
 def scrape_search_results(keyword):
+    cached = _RESULTS_CACHE.get(keyword)
+    if cached is not None:
+        return cached
+
     url = f"https://www.google.com/search?q={keyword}"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, 'html.parser')
-    
+
+    response = _SESSION.get(url)
+    tree = HTMLParser(response.text)
+
     results = []
-    for item in soup.find_all('h3'):
-        title = item.get_text()
-        link = item.find_parent('a')['href']
+    for item in tree.css('h3'):
+        title = item.text()
+        anchor = item.parent
+        while anchor is not None and anchor.tag != 'a':
+            anchor = anchor.parent
+        link = anchor.attributes.get('href', '') if anchor else ''
         results.append({'title': title, 'link': link})
-    
+
+    # Only successful responses are worth remembering
+    if response.status_code == 200:
+        _RESULTS_CACHE[keyword] = results
     return results
 
 if __name__ == "__main__":
@@ -62,24 +81,37 @@ if __name__ == "__main__":
 
 ### 3. **Automated Monitoring of Keywords**
 
-This script continuously monitors online mentions using `requests` and `BeautifulSoup`, and sends alerts if unwanted content is found.
+This script continuously monitors online mentions using `aiohttp` and `selectolax`, watching many keywords concurrently on one event loop and sending alerts if unwanted content is found.
 
 ```python
-import requests
-from bs4 import BeautifulSoup
-import time
-
-def monitor_keyword(keyword, check_interval=3600):
-    while True:
-        results = scrape_search_results(keyword)
-        if results:
-            for result in results:
-                if "unwanted" in result['title'].lower():
-                    print(f"Alert! Unwanted content found: {result['link']}")
-        time.sleep(check_interval)
+import asyncio
+
+import aiohttp
+from selectolax.parser import HTMLParser
+
+async def check_keyword(session, keyword):
+    url = f"https://www.google.com/search?q={keyword}"
+    async with session.get(url) as response:
+        html = await response.text()
+
+    for item in HTMLParser(html).css('h3'):
+        title = item.text()
+        if "unwanted" in title.lower():
+            parent = item.parent
+            link = parent.attributes.get('href', '') if parent else ''
+            print(f"Alert! Unwanted content found: {link or title}")
+
+async def monitor_keywords(keywords, check_interval=3600):
+    # One event loop watches every keyword; fetches overlap instead of a
+    # thread sleeping between one-at-a-time requests.
+    async with aiohttp.ClientSession(headers={"User-Agent": "Mozilla/5.0"}) as session:
+        while True:
+            await asyncio.gather(*(check_keyword(session, keyword)
+                                   for keyword in keywords))
+            await asyncio.sleep(check_interval)
 
 if __name__ == "__main__":
-    monitor_keyword("negative review")
+    asyncio.run(monitor_keywords(["negative review", "bad press"]))
 ```
 
 ### 4. **API Request to Google for Removal**
@@ -90,21 +122,32 @@ This example uses the Google Search Console API to submit a removal request for
 from googleapiclient.discovery import build
 from google.oauth2 import service_account
 
-def remove_url(api_key, url):
-    credentials = service_account.Credentials.from_service_account_file('path/to/credentials.json')
-    service = build('webmasters', 'v3', credentials=credentials)
-    
-    request_body = {
-        'url': url,
-        'type': 'URL'
-    }
-    
-    service.urlRemovals().create(siteUrl='https://www.example.com', body=request_body).execute()
+_service = None
+
+def _get_service():
+    """ Build the Search Console client once; credential loading and API
+    discovery are too slow to repeat per call. """
+    global _service
+    if _service is None:
+        credentials = service_account.Credentials.from_service_account_file('path/to/credentials.json')
+        _service = build('webmasters', 'v3', credentials=credentials)
+    return _service
+
+def remove_urls(api_key, urls):
+    service = _get_service()
+
+    # One batched round-trip instead of a TLS+HTTP exchange per URL
+    batch = service.new_batch_http_request()
+    for url in urls:
+        batch.add(service.urlRemovals().create(
+            siteUrl='https://www.example.com',
+            body={'url': url, 'type': 'URL'}))
+    batch.execute()
 
 if __name__ == "__main__":
     api_key = "YOUR_API_KEY"
-    url = "https://www.example.com/unwanted_content"
-    remove_url(api_key, url)
+    urls = ["https://www.example.com/unwanted_content"]
+    remove_urls(api_key, urls)
 ```
 
 ### 5. **Automated Content Creation for Reputation Management**
@@ -159,16 +202,17 @@ if __name__ == "__main__":
 This script uses the `requests` library to fetch a webpage and analyzes it for SEO factors that can improve positive content ranking.
 
 ```python
-import requests
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 
 def analyze_seo(url):
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
-    
-    title = soup.title.string if soup.title else 'No title'
-    meta_desc = soup.find('meta', attrs={'name': 'description'})['content'] if soup.find('meta', attrs={'name': 'description'}) else 'No description'
-    
+    response = _SESSION.get(url)
+    tree = HTMLParser(response.text)
+
+    title_node = tree.css_first('title')
+    title = title_node.text() if title_node else 'No title'
+    meta_tag = tree.css_first('meta[name="description"]')
+    meta_desc = meta_tag.attributes.get('content', 'No description') if meta_tag else 'No description'
+
     print(f"Title: {title}\nMeta Description: {meta_desc}\n")
 
 if __name__ == "__main__":
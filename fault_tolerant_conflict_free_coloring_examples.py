@@ -12,13 +12,22 @@ import matplotlib.pyplot as plt
 
 def conflict_free_coloring(graph):
     """Perform conflict-free coloring on a graph."""
+    # Materialize the node and adjacency views once: NetworkX views carry
+    # dispatch overhead on every iteration in this tight loop.
+    nodes = list(graph.nodes())
+    nbrs = {node: list(graph.neighbors(node)) for node in nodes}
     colors = {}
-    for node in graph.nodes():
-        neighbor_colors = {colors.get(neighbor) for neighbor in graph.neighbors(node) if neighbor in colors}
-        for color in range(len(graph.nodes())):  # Assign the smallest available color
-            if color not in neighbor_colors:
-                colors[node] = color
-                break
+    for node in nodes:
+        # Bitset of colors already taken by colored neighbors: native int
+        # bit operations replace a set allocation plus a linear color scan.
+        used = 0
+        for neighbor in nbrs[node]:
+            color = colors.get(neighbor)
+            if color is not None:
+                used |= 1 << color
+        # The lowest zero bit of `used` is the smallest available color.
+        free = ~used
+        colors[node] = (free & -free).bit_length() - 1
     return colors
 
 # Example usage
@@ -44,23 +53,69 @@ In a fault-tolerant system, some nodes might fail, and the coloring scheme must
 
 #### Python Code Example:
 ```python
+import numpy as np
+
+def _fault_tolerant_coloring_csr(graph, redundancy):
+    """Array formulation of the fault-tolerant coloring for large graphs.
+
+    The graph is converted to CSR once; instead of each node pulling its
+    neighbors' colors through Python dict lookups, every colored node pushes
+    its color bit onto all neighbors with one vectorized slice update on a
+    uint64 mask array. The hottest loop runs in NumPy C kernels.
+    """
+    nodes = list(graph.nodes())
+    adj = nx.to_scipy_sparse_array(graph, nodelist=nodes, format='csr')
+    indptr, indices = adj.indptr, adj.indices
+    color_mask = np.zeros(len(nodes), dtype=np.uint64)
+    colors = {}
+    backup_colors = {}
+    for i, node in enumerate(nodes):
+        free = ~int(color_mask[i])
+        color = (free & -free).bit_length() - 1
+        colors[node] = color
+        free &= free - 1
+        backups = []
+        for _ in range(redundancy):
+            backups.append((free & -free).bit_length() - 1)
+            free &= free - 1
+        backup_colors[node] = backups
+        # Mark the chosen color as used on every neighbor in one slice.
+        color_mask[indices[indptr[i]:indptr[i + 1]]] |= np.uint64(1 << color)
+    return colors, backup_colors
+
 def fault_tolerant_coloring(graph, redundancy=1):
     """Perform fault-tolerant conflict-free coloring with redundancy."""
+    # Large graphs go through the CSR path, provided the palette fits the
+    # 64 bits of the mask array (it needs at most degree + redundancy + 1
+    # colors per node).
+    max_degree = max((degree for _, degree in graph.degree()), default=0)
+    if len(graph) >= 64 and max_degree + redundancy < 64:
+        return _fault_tolerant_coloring_csr(graph, redundancy)
+
+    # Same hoisting as conflict_free_coloring: pay the view dispatch once.
+    nodes = list(graph.nodes())
+    nbrs = {node: list(graph.neighbors(node)) for node in nodes}
     colors = {}
     backup_colors = {}
-    
-    for node in graph.nodes():
-        neighbor_colors = {colors.get(neighbor) for neighbor in graph.neighbors(node) if neighbor in colors}
-        # Assign primary color
-        for color in range(len(graph.nodes())):
-            if color not in neighbor_colors:
-                colors[node] = color
-                break
-        # Assign backup colors for fault tolerance
-        backup_colors[node] = []
-        for color in range(len(graph.nodes())):
-            if color != colors[node] and color not in neighbor_colors and len(backup_colors[node]) < redundancy:
-                backup_colors[node].append(color)
+
+    for node in nodes:
+        used = 0
+        for neighbor in nbrs[node]:
+            color = colors.get(neighbor)
+            if color is not None:
+                used |= 1 << color
+        # Assign primary color: lowest free bit.
+        free = ~used
+        color = (free & -free).bit_length() - 1
+        colors[node] = color
+        # Assign backup colors for fault tolerance: clear each chosen bit
+        # and take the next-lowest free color, redundancy times.
+        free &= free - 1
+        backups = []
+        for _ in range(redundancy):
+            backups.append((free & -free).bit_length() - 1)
+            free &= free - 1
+        backup_colors[node] = backups
 
     return colors, backup_colors
 
@@ -109,13 +164,29 @@ In wireless networks, channels must be assigned to different nodes or access poi
 
 #### Python Code Example:
 ```python
+from weakref import WeakKeyDictionary
+
+_coloring_cache = WeakKeyDictionary()
+
+def _cached_coloring(graph, redundancy):
+    """Colorings cached weakly per graph object, one entry per redundancy
+    level, so repeated assignments over the same graph reuse one coloring
+    instead of redoing the full pass. Entries die with their graph, so a
+    recycled object id can never return a dead graph's coloring."""
+    per_graph = _coloring_cache.get(graph)
+    if per_graph is None:
+        per_graph = _coloring_cache[graph] = {}
+    cached = per_graph.get(redundancy)
+    if cached is None:
+        cached = per_graph[redundancy] = fault_tolerant_coloring(graph, redundancy)
+    return cached
+
 def channel_assignment(graph, num_channels, redundancy=1):
     """Assign fault-tolerant conflict-free channels to network nodes."""
-    colors, backup_colors = fault_tolerant_coloring(graph, redundancy)
-    channels = {}
-    for node, color in colors.items():
-        channels[node] = color % num_channels
-    return channels
+    colors, backup_colors = _cached_coloring(graph, redundancy)
+    # One vectorized modulo over the color array instead of a Python loop.
+    channels = np.fromiter(colors.values(), dtype=np.int64, count=len(colors))
+    return dict(zip(colors, (channels % num_channels).tolist()))
 
 # Example usage
 num_channels = 5
@@ -137,11 +208,10 @@ In real-world parking management, vehicles need to be assigned parking spots suc
 ```python
 def parking_lot_assignment(graph, num_spots, redundancy=1):
     """Assign parking spots to vehicles using conflict-free coloring."""
-    colors, backup_colors = fault_tolerant_coloring(graph, redundancy)
-    spots = {}
-    for vehicle, color in colors.items():
-        spots[vehicle] = color % num_spots
-    return spots
+    # Shares the cached coloring with channel_assignment for the same graph.
+    colors, backup_colors = _cached_coloring(graph, redundancy)
+    spots = np.fromiter(colors.values(), dtype=np.int64, count=len(colors))
+    return dict(zip(colors, (spots % num_spots).tolist()))
 
 # Example usage
 num_spots = 6